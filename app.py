@@ -1,6 +1,41 @@
+import html
+
 import streamlit as st
 from datetime import datetime
-from pawpal_system import Owner, Pet, Task, Scheduler, Priority
+from pawpal_system import Owner, Pet, Task, Scheduler, Priority, _PRIORITY_NAMES
+
+# Lookup tables used while rendering task rows (built once, not per row).
+# Priority is an IntEnum, so these also accept plain int priority values.
+_PRIORITY_COLORS = {Priority.HIGH: "#ef4444", Priority.MEDIUM: "#f59e0b", Priority.LOW: "#16a34a"}
+_PRIORITY_INDEX = {Priority.LOW: 0, Priority.MEDIUM: 1, Priority.HIGH: 2}
+_PRIORITY_BY_NAME = {"LOW": Priority.LOW, "MEDIUM": Priority.MEDIUM, "HIGH": Priority.HIGH}
+_STATUS_COLORS = {
+    "pending": "#ca8a04",
+    "scheduled": "#0284c7",
+    "completed": "#16a34a",
+    "skipped": "#64748b"
+}
+
+PRIORITY_OPTIONS = ("LOW", "MEDIUM", "HIGH")
+FREQUENCY_OPTIONS = ("once", "daily", "weekly")
+RECURRING_FREQUENCIES = ("daily", "weekly")
+
+# Column layouts shared by every row of the same kind
+PET_ROW_COLUMNS = (5, 1)  # details, Remove
+TASK_ROW_COLUMNS = (7.1, 1, 1, 1)  # details + chips, Done, Edit, Delete
+SCHEDULE_ROW_COLUMNS = (1, 1, 1, 1)  # time, duration, priority, Complete
+
+TASK_PAGE_SIZE = 25  # Task rows rendered per page in the task list
+
+AVAILABLE_HOUR_OPTIONS = tuple(x / 2 for x in range(1, 17))  # 0.5 -> 8.0
+
+_INVALID_TIME_RESULT = ("Invalid time format! Use HH:MM (e.g., 08:00)", None)
+
+# Shared inline-style template for priority/status chips
+_CHIP_TMPL = (
+    '<span style="display:inline-block;padding:0.15rem 0.45rem;border-radius:999px;'
+    'background:{bg};color:{fg};font-size:0.8rem;font-weight:700;{extra}">{text}</span>'
+)
 
 st.set_page_config(
     page_title="PawPal+",
@@ -31,52 +66,104 @@ if "schedule" not in st.session_state:
 if "edit_task_id" not in st.session_state:
     st.session_state.edit_task_id = None
 
+# Revision counter bumped on every pet/task mutation; used to invalidate cached task views
+if "owner_rev" not in st.session_state:
+    st.session_state.owner_rev = 0
+
+# The owner object is stable for the whole session, so one scheduler can be reused
+if "scheduler" not in st.session_state:
+    st.session_state.scheduler = Scheduler(owner=st.session_state.owner)
+
+
+@st.cache_resource
+def _theme_css() -> str:
+    """Return the static app stylesheet, built once per server process."""
+    return """
+    <style>
+        .block-container {
+            padding-top: 1.2rem;
+            padding-bottom: 2rem;
+        }
+        .pawpal-hero {
+            background: linear-gradient(120deg, #f0f9ff 0%, #fef9c3 100%);
+            border: 1px solid #e2e8f0;
+            border-radius: 14px;
+            padding: 1.1rem 1.2rem;
+            margin-bottom: 1rem;
+        }
+        .pawpal-hero h1 {
+            margin: 0;
+            font-size: 1.6rem;
+            color: #0f172a;
+        }
+        .pawpal-hero p {
+            margin: 0.4rem 0 0 0;
+            color: #334155;
+        }
+        .pawpal-section {
+            margin-top: 0.6rem;
+            margin-bottom: 0.35rem;
+            color: #0f172a;
+            font-weight: 700;
+            font-size: 1.1rem;
+        }
+        .pawpal-chip {
+            display: inline-block;
+            padding: 0.15rem 0.45rem;
+            border-radius: 999px;
+            background: #e0f2fe;
+            color: #075985;
+            font-size: 0.8rem;
+            font-weight: 600;
+            margin-right: 0.3rem;
+        }
+    </style>
+    """
+
 
 def apply_app_theme():
     """Apply lightweight styling to improve readability and visual hierarchy."""
-    st.markdown(
-        """
-        <style>
-            .block-container {
-                padding-top: 1.2rem;
-                padding-bottom: 2rem;
-            }
-            .pawpal-hero {
-                background: linear-gradient(120deg, #f0f9ff 0%, #fef9c3 100%);
-                border: 1px solid #e2e8f0;
-                border-radius: 14px;
-                padding: 1.1rem 1.2rem;
-                margin-bottom: 1rem;
-            }
-            .pawpal-hero h1 {
-                margin: 0;
-                font-size: 1.6rem;
-                color: #0f172a;
-            }
-            .pawpal-hero p {
-                margin: 0.4rem 0 0 0;
-                color: #334155;
-            }
-            .pawpal-section {
-                margin-top: 0.6rem;
-                margin-bottom: 0.35rem;
-                color: #0f172a;
-                font-weight: 700;
-                font-size: 1.1rem;
-            }
-            .pawpal-chip {
-                display: inline-block;
-                padding: 0.15rem 0.45rem;
-                border-radius: 999px;
-                background: #e0f2fe;
-                color: #075985;
-                font-size: 0.8rem;
-                font-weight: 600;
-                margin-right: 0.3rem;
-            }
-        </style>
-        """,
-        unsafe_allow_html=True
+    st.markdown(_theme_css(), unsafe_allow_html=True)
+
+
+def mark_owner_changed():
+    """Bump the owner revision so cached task views are rebuilt on the next rerun."""
+    st.session_state.owner_rev += 1
+
+
+def initial_due_date(frequency: str):
+    """Return today's timestamp for recurring tasks, or None for one-off tasks."""
+    if frequency not in RECURRING_FREQUENCIES:
+        return None
+    return datetime.now()
+
+
+def cached_until_owner_changes(name: str, compute):
+    """Return a session-cached value, recomputing it only after the owner revision changes."""
+    rev_key = f"{name}_rev"
+    if st.session_state.get(rev_key) != st.session_state.owner_rev:
+        st.session_state[name] = compute()
+        st.session_state[rev_key] = st.session_state.owner_rev
+    return st.session_state[name]
+
+
+def owner_fingerprint(owner: Owner) -> tuple:
+    """Summarize the owner state that affects scheduling, used to reuse an up-to-date schedule."""
+    return (
+        owner.name,
+        owner.available_time_minutes,
+        tuple(sorted(owner.preferences.items())),
+        tuple(
+            (
+                pet.name,
+                pet.type,
+                tuple(
+                    (t.description, t.duration, int(t.priority), t.frequency, t.time, t.status)
+                    for t in pet.tasks
+                )
+            )
+            for pet in owner.pets
+        )
     )
 
 
@@ -87,28 +174,28 @@ def pet_label(pet: Pet) -> str:
 
 def priority_chip(priority_value: int) -> str:
     """Return a compact color-tagged priority label."""
-    name = Priority(priority_value).name
-    color_map = {"HIGH": "#ef4444", "MEDIUM": "#f59e0b", "LOW": "#16a34a"}
-    color = color_map[name]
-    return (
-        f'<span style="display:inline-block;padding:0.15rem 0.45rem;border-radius:999px;'
-        f'background:{color}22;color:{color};font-size:0.8rem;font-weight:700;">{name}</span>'
-    )
+    name = _PRIORITY_NAMES[priority_value]
+    color = _PRIORITY_COLORS[priority_value]
+    return _CHIP_TMPL.format(bg=color + "22", fg=color, extra="", text=name)
 
 
 def status_chip(status: str) -> str:
     """Return a compact color-tagged status label."""
-    color_map = {
-        "pending": "#ca8a04",
-        "scheduled": "#0284c7",
-        "completed": "#16a34a",
-        "skipped": "#64748b"
-    }
-    color = color_map.get(status, "#334155")
+    color = _STATUS_COLORS.get(status, "#334155")
+    return _CHIP_TMPL.format(bg=color + "22", fg=color, extra="text-transform:capitalize;", text=status)
+
+
+def task_row_html(task: Task, pet_name: str) -> str:
+    """Build the HTML for a task row's details and chips so it renders in one markdown call."""
+    time_html = f" 🕐 {html.escape(task.time)}" if task.time else ""
     return (
-        f'<span style="display:inline-block;padding:0.15rem 0.45rem;border-radius:999px;'
-        f'background:{color}22;color:{color};font-size:0.8rem;font-weight:700;text-transform:capitalize;">'
-        f"{status}</span>"
+        '<div style="display:flex;align-items:center;gap:1rem;">'
+        f'<div style="flex:3.3;"><strong>{html.escape(task.description or "")}</strong>'
+        f"<br>{html.escape(pet_name)}{time_html}</div>"
+        f'<div style="flex:1.2;"><code>{task.duration} min</code></div>'
+        f'<div style="flex:1.2;">{priority_chip(task.priority)}</div>'
+        f'<div style="flex:1.4;">{status_chip(task.status)}</div>'
+        "</div>"
     )
 
 
@@ -118,15 +205,102 @@ def parse_task_time(value: str):
     if not cleaned:
         return "", None
 
-    if len(cleaned) == 5 and cleaned[2] == ":":
-        try:
-            hours, mins = map(int, cleaned.split(":"))
-            if 0 <= hours < 24 and 0 <= mins < 60:
-                return "", f"{hours:02d}:{mins:02d}"
-        except ValueError:
-            pass
+    hours_text, sep, mins_text = cleaned.partition(":")
+    if (
+        sep != ":"
+        or len(hours_text) != 2
+        or len(mins_text) != 2
+        or not (hours_text.isdecimal() and mins_text.isdecimal())
+    ):
+        return _INVALID_TIME_RESULT
+
+    hours = int(hours_text)
+    mins = int(mins_text)
+    if hours < 24 and mins < 60:
+        return "", f"{hours:02d}:{mins:02d}"
+
+    return _INVALID_TIME_RESULT
+
+
+@st.fragment
+def render_edit_task_form(task: Task, edit_pet_options: dict, edit_pet_option_labels: tuple,
+                          edit_pet_positions: dict):
+    """Render the inline edit form for a task; widget changes only rerun this fragment."""
+    task_id = task.uid
+    st.caption("Edit task")
+    current_pet_idx = edit_pet_positions.get(id(task.pet), 0)
+    edit_col1, edit_col2 = st.columns(2)
+    with edit_col1:
+        edit_desc = st.text_input(
+            "Description",
+            value=task.description or "",
+            key=f"edit_desc_{task_id}"
+        )
+        edit_duration = st.number_input(
+            "Duration (minutes)",
+            min_value=1,
+            max_value=300,
+            value=int(task.duration) if task.duration else 30,
+            key=f"edit_duration_{task_id}"
+        )
+        edit_time = st.text_input(
+            "Scheduled Time (HH:MM)",
+            value=task.time or "",
+            key=f"edit_time_{task_id}",
+            help="Optional - leave blank for unscheduled"
+        )
+    with edit_col2:
+        edit_pet_label = st.selectbox(
+            "Pet",
+            edit_pet_option_labels,
+            index=current_pet_idx,
+            key=f"edit_pet_{task_id}"
+        )
+        edit_priority = st.selectbox(
+            "Priority",
+            PRIORITY_OPTIONS,
+            index=_PRIORITY_INDEX[task.priority],
+            key=f"edit_priority_{task_id}"
+        )
+        edit_frequency = st.selectbox(
+            "Frequency",
+            FREQUENCY_OPTIONS,
+            index=FREQUENCY_OPTIONS.index(task.frequency) if task.frequency in FREQUENCY_OPTIONS else 0,
+            key=f"edit_frequency_{task_id}"
+        )
 
-    return "Invalid time format! Use HH:MM (e.g., 08:00)", None
+    save_col, cancel_col = st.columns(2)
+    with save_col:
+        if st.button("Save Changes", key=f"save_task_{task_id}", use_container_width=True):
+            time_error, parsed_time = parse_task_time(edit_time)
+            if time_error:
+                st.error(time_error)
+            elif not edit_desc.strip():
+                st.error("Please enter a task description")
+            else:
+                new_due_date = initial_due_date(edit_frequency)
+                new_pet = edit_pet_options[edit_pet_label]
+                task.update_task(
+                    description=edit_desc.strip(),
+                    duration=edit_duration,
+                    priority=_PRIORITY_BY_NAME[edit_priority],
+                    frequency=edit_frequency,
+                    time=parsed_time if parsed_time else None,
+                    due_date=new_due_date
+                )
+                if task.pet is not new_pet:
+                    if task.pet:
+                        task.pet.remove_task(task)
+                    new_pet.add_task(task)
+                mark_owner_changed()
+                st.session_state.edit_task_id = None
+                st.success("✅ Task updated")
+                # Saved edits affect the task list and metrics, so rerun the whole app
+                st.rerun(scope="app")
+    with cancel_col:
+        if st.button("Cancel", key=f"cancel_task_{task_id}", use_container_width=True):
+            st.session_state.edit_task_id = None
+            st.rerun(scope="app")
 
 # ============================================================================
 # App Header
@@ -142,14 +316,19 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-total_pets = len(st.session_state.owner.pets)
-total_tasks = len(st.session_state.owner.get_all_tasks())
-pending_tasks = len([t for t in st.session_state.owner.get_all_tasks() if t.status == "pending"])
+# Bind the session owner (and its pet list) once; both are stable for the whole rerun
+owner = st.session_state.owner
+pets = owner.pets
+
+total_pets = len(pets)
+all_tasks = owner.get_all_tasks()
+total_tasks = len(all_tasks)
+pending_tasks = len(owner.get_pending_tasks())
 quick_col1, quick_col2, quick_col3, quick_col4 = st.columns(4)
 quick_col1.metric("Pets", total_pets)
 quick_col2.metric("Total Tasks", total_tasks)
 quick_col3.metric("Pending", pending_tasks)
-quick_col4.metric("Available Time", f"{st.session_state.owner.available_time_minutes} min")
+quick_col4.metric("Available Time", f"{owner.available_time_minutes} min")
 
 with st.sidebar:
     st.header("PawPal+ Guide")
@@ -168,29 +347,26 @@ col1, col2 = st.columns(2)
 with col1:
     owner_name = st.text_input(
         "Your Name",
-        value=st.session_state.owner.name or "",
+        value=owner.name or "",
         help="Enter your name"
     )
-    if owner_name != st.session_state.owner.name:
-        st.session_state.owner.name = owner_name
+    if owner_name != owner.name:
+        owner.name = owner_name
 
 with col2:
-    available_hour_options = [x / 2 for x in range(1, 17)]  # 0.5 -> 8.0
-    current_hours = max(0.5, min(8.0, st.session_state.owner.available_time_minutes / 60))
-    default_idx = min(
-        range(len(available_hour_options)),
-        key=lambda i: abs(available_hour_options[i] - current_hours)
-    )
+    current_hours = max(0.5, min(8.0, owner.available_time_minutes / 60))
+    # Options are half-hour steps, so the nearest index is just hours * 2 - 1
+    default_idx = max(0, min(len(AVAILABLE_HOUR_OPTIONS) - 1, round(current_hours * 2) - 1))
     selected_hours = st.selectbox(
         "Available Time (hours)",
-        available_hour_options,
+        AVAILABLE_HOUR_OPTIONS,
         index=default_idx,
         format_func=lambda h: f"{h:g} hrs",
         help="How much time do you have available today?"
     )
     selected_minutes = int(selected_hours * 60)
-    if selected_minutes != st.session_state.owner.available_time_minutes:
-        st.session_state.owner.available_time_minutes = selected_minutes
+    if selected_minutes != owner.available_time_minutes:
+        owner.available_time_minutes = selected_minutes
 
 # Time preferences
 time_preference = st.selectbox(
@@ -200,9 +376,9 @@ time_preference = st.selectbox(
 )
 
 if time_preference != "None":
-    st.session_state.owner.preferences["preferred_time_window"] = time_preference
-elif "preferred_time_window" in st.session_state.owner.preferences:
-    del st.session_state.owner.preferences["preferred_time_window"]
+    owner.preferences["preferred_time_window"] = time_preference
+elif "preferred_time_window" in owner.preferences:
+    del owner.preferences["preferred_time_window"]
 
 st.divider()
 
@@ -212,7 +388,7 @@ st.divider()
 st.markdown('<p class="pawpal-section">🐕 Manage Pets</p>', unsafe_allow_html=True)
 
 # Add new pet
-with st.expander("➕ Add New Pet", expanded=len(st.session_state.owner.pets) == 0):
+with st.expander("➕ Add New Pet", expanded=len(pets) == 0):
     selected_pet_type = st.selectbox(
         "Type",
         ["Dog", "Cat", "Bird", "Other"],
@@ -241,26 +417,20 @@ with st.expander("➕ Add New Pet", expanded=len(st.session_state.owner.pets) ==
         elif selected_pet_type == "Other" and not pet_type_value:
             st.error("Please enter the animal type")
         else:
-            duplicate = any(
-                pet.name
-                and pet.type
-                and pet.name.strip().lower() == pet_name_clean.lower()
-                and pet.type.strip().lower() == pet_type_value.lower()
-                for pet in st.session_state.owner.pets
-            )
-            if duplicate:
+            if owner.has_pet(pet_name_clean, pet_type_value):
                 st.warning(f"You already have a {pet_type_value.lower()} with the same name")
             else:
                 new_pet = Pet(name=pet_name_clean, age=new_pet_age, type=pet_type_value)
-                st.session_state.owner.add_pet(new_pet)
+                owner.add_pet(new_pet)
+                mark_owner_changed()
                 st.success(f"✅ Added {pet_name_clean} to your pets!")
                 st.rerun()
 
 # Display existing pets
-if st.session_state.owner.pets:
+if pets:
     st.subheader("Your Pets")
-    for idx, pet in enumerate(st.session_state.owner.pets):
-        col1, col2 = st.columns([5, 1])
+    for idx, pet in enumerate(pets):
+        col1, col2 = st.columns(PET_ROW_COLUMNS)
         with col1:
             st.markdown(
                 f"**{pet.name}**  \n"
@@ -268,7 +438,8 @@ if st.session_state.owner.pets:
             )
         with col2:
             if st.button("Remove", key=f"remove_pet_{idx}", help=f"Remove {pet.name}", use_container_width=True):
-                st.session_state.owner.remove_pet(pet)
+                owner.remove_pet(pet)
+                mark_owner_changed()
                 st.rerun()
 else:
     st.info("No pets added yet. Add your first pet above!")
@@ -281,11 +452,21 @@ st.divider()
 st.markdown('<p class="pawpal-section">📋 Manage Tasks</p>', unsafe_allow_html=True)
 
 # Select pet for task
-if st.session_state.owner.pets:
-    pet_options = {pet_label(p): p for p in st.session_state.owner.pets}
+if pets:
+    edit_task_id = st.session_state.edit_task_id
+
+    # Build pet selector labels once per rerun and reuse them for every selectbox
+    pet_options = {pet_label(p): p for p in pets}
+    pet_option_labels = tuple(pet_options)
+    filter_pet_options = {"All Pets": None, **pet_options}
+    filter_pet_option_labels = tuple(filter_pet_options)
+    edit_pet_options = {f"{p.name} ({p.type})": p for p in pets}
+    edit_pet_option_labels = tuple(edit_pet_options)
+    edit_pet_positions = {id(p): i for i, p in enumerate(edit_pet_options.values())}
+
     selected_pet_key = st.selectbox(
         "Select Pet for Task",
-        list(pet_options.keys()),
+        pet_option_labels,
         help="Choose which pet this task is for"
     )
     selected_pet = pet_options[selected_pet_key]
@@ -316,13 +497,13 @@ if st.session_state.owner.pets:
             with col2:
                 task_priority = st.selectbox(
                     "Priority",
-                    ["LOW", "MEDIUM", "HIGH"],
+                    PRIORITY_OPTIONS,
                     index=1,
                     key="task_priority_input"
                 )
                 task_frequency = st.selectbox(
                     "Frequency",
-                    ["once", "daily", "weekly"],
+                    FREQUENCY_OPTIONS,
                     key="task_frequency_input"
                 )
 
@@ -330,9 +511,6 @@ if st.session_state.owner.pets:
 
         if add_task_clicked:
             if task_desc:
-                # Map priority string to Priority enum
-                priority_map = {"LOW": Priority.LOW, "MEDIUM": Priority.MEDIUM, "HIGH": Priority.HIGH}
-
                 # Validate time format if provided
                 time_error, parsed_time = parse_task_time(task_time)
                 if time_error:
@@ -344,12 +522,13 @@ if st.session_state.owner.pets:
                     new_task = Task(
                         description=task_desc.strip(),
                         duration=task_duration,
-                        priority=priority_map[task_priority],
+                        priority=_PRIORITY_BY_NAME[task_priority],
                         frequency=task_frequency,
                         time=parsed_time if parsed_time else None,
-                        due_date=datetime.now() if task_frequency in ["daily", "weekly"] else None
+                        due_date=initial_due_date(task_frequency)
                     )
                     selected_pet.add_task(new_task)
+                    mark_owner_changed()
                     st.success(f"✅ Added task '{task_desc.strip()}' for {selected_pet.name}!")
                     st.rerun()
             else:
@@ -358,175 +537,109 @@ if st.session_state.owner.pets:
     # Display tasks with filtering and sorting
     st.subheader("Current Tasks")
 
-    # Create scheduler for filtering/sorting
-    scheduler = Scheduler(owner=st.session_state.owner)
-    all_tasks = st.session_state.owner.get_all_tasks()
+    # Reuse the session scheduler for filtering/sorting
+    scheduler = st.session_state.scheduler
 
-    # Filter and Sort Controls
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        filter_pet_options = {"All Pets": None}
-        for pet in st.session_state.owner.pets:
-            filter_pet_options[pet_label(pet)] = pet
-        filter_pet = st.selectbox(
-            "Filter by Pet",
-            list(filter_pet_options.keys()),
-            key="filter_pet"
-        )
-    with col2:
-        filter_status = st.selectbox(
-            "Filter by Status",
-            ["All Status", "pending", "scheduled", "completed", "skipped"],
-            key="filter_status"
-        )
-    with col3:
-        sort_by_time = st.checkbox("Sort by Time", value=False, key="sort_time")
-
-    # Apply filters
-    filtered_tasks = all_tasks
-    if filter_pet != "All Pets":
-        selected_filter_pet = filter_pet_options[filter_pet]
-        filtered_tasks = scheduler.filter_tasks(filtered_tasks, pet_name=selected_filter_pet.name)
-    if filter_status != "All Status":
-        filtered_tasks = scheduler.filter_tasks(filtered_tasks, status=filter_status)
-
-    # Apply sorting
-    if sort_by_time:
-        filtered_tasks = scheduler.sort_by_time(filtered_tasks)
-
-    # Conflict Detection
-    if all_tasks:
-        conflicts = scheduler.detect_conflicts(all_tasks)
-        if conflicts:
-            st.warning(f"⚠️ **{len(conflicts)} Scheduling Conflict(s) Detected!**")
-            with st.expander("View Conflicts", expanded=False):
-                for conflict in conflicts:
-                    st.error(conflict['message'])
+    # Filter and Sort Controls (batched in a form so changes apply in one rerun)
+    with st.form("task_filters_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            filter_pet = st.selectbox(
+                "Filter by Pet",
+                filter_pet_option_labels,
+                key="filter_pet"
+            )
+        with col2:
+            filter_status = st.selectbox(
+                "Filter by Status",
+                ["All Status", "pending", "scheduled", "completed", "skipped"],
+                key="filter_status"
+            )
+        with col3:
+            sort_by_time = st.checkbox("Sort by Time", value=False, key="sort_time")
+
+        st.form_submit_button("Apply Filters")
+
+    # Apply filters and sorting, reusing the cached view while nothing has changed
+    filtered_key = (st.session_state.owner_rev, filter_pet, filter_status, sort_by_time)
+    if st.session_state.get("filtered_key") == filtered_key:
+        filtered_tasks = st.session_state.filtered_tasks
+    else:
+        filtered_tasks = all_tasks
+        if filter_pet != "All Pets":
+            selected_filter_pet = filter_pet_options[filter_pet]
+            filtered_tasks = scheduler.filter_tasks(filtered_tasks, pet_name=selected_filter_pet.name)
+        if filter_status != "All Status":
+            filtered_tasks = scheduler.filter_tasks(filtered_tasks, status=filter_status)
+
+        if sort_by_time:
+            filtered_tasks = scheduler.sort_by_time(filtered_tasks)
+
+        st.session_state.filtered_key = filtered_key
+        st.session_state.filtered_tasks = filtered_tasks
+
+    # Conflict Detection (only tasks with a fixed time can overlap)
+    conflicts = cached_until_owner_changes(
+        "task_conflicts", lambda: scheduler.detect_conflicts(all_tasks)
+    )
+    if conflicts:
+        st.warning(f"⚠️ **{len(conflicts)} Scheduling Conflict(s) Detected!**")
+        with st.expander("View Conflicts", expanded=False):
+            for conflict in conflicts:
+                st.error(conflict['message'])
 
     # Display filtered tasks
     if filtered_tasks:
-        for idx, task in enumerate(filtered_tasks):
+        # Only render one page of rows so large task lists stay responsive
+        page_count = (len(filtered_tasks) - 1) // TASK_PAGE_SIZE + 1
+        page = 1
+        if page_count > 1:
+            # The widget reads its value from session state, so set/clamp it there only
+            if "task_page" not in st.session_state:
+                st.session_state.task_page = 1
+            elif st.session_state.task_page > page_count:
+                st.session_state.task_page = page_count
+            page = st.number_input("Page", min_value=1, max_value=page_count, key="task_page")
+            st.caption(f"Showing page {page} of {page_count} ({len(filtered_tasks)} tasks)")
+        page_start = (page - 1) * TASK_PAGE_SIZE
+
+        for task in filtered_tasks[page_start:page_start + TASK_PAGE_SIZE]:
             pet_name = task.pet.name if task.pet else "No pet"
-            time_str = f" 🕐 {task.time}" if task.time else ""
-            task_id = id(task)
+            task_id = task.uid
 
             with st.container():
-                col1, col2, col3, col4, col5, col6, col7 = st.columns([3.3, 1.2, 1.2, 1.4, 1, 1, 1])
+                col1, col2, col3, col4 = st.columns(TASK_ROW_COLUMNS)
                 with col1:
-                    st.markdown(f"**{task.description}**  \n{pet_name}{time_str}")
+                    st.markdown(task_row_html(task, pet_name), unsafe_allow_html=True)
                 with col2:
-                    st.markdown(f"`{task.duration} min`")
-                with col3:
-                    st.markdown(priority_chip(task.priority), unsafe_allow_html=True)
-                with col4:
-                    st.markdown(status_chip(task.status), unsafe_allow_html=True)
-                with col5:
                     # Mark complete button for recurring tasks
-                    if task.frequency in ["daily", "weekly"] and task.status != "completed":
+                    if task.frequency in RECURRING_FREQUENCIES and task.status != "completed":
                         if st.button(
                             "Done",
-                            key=f"complete_{pet_name}_{idx}",
+                            key=f"complete_{task_id}",
                             help="Mark complete (auto-creates next)",
                             use_container_width=True
                         ):
                             new_task = task.mark_complete()
+                            mark_owner_changed()
                             if new_task:
                                 st.success(f"✅ Task completed! Created new task for next occurrence.")
                             st.rerun()
-                with col6:
-                    if st.button("Edit", key=f"edit_task_{pet_name}_{idx}", help="Edit task", use_container_width=True):
+                with col3:
+                    if st.button("Edit", key=f"edit_task_{task_id}", help="Edit task", use_container_width=True):
                         st.session_state.edit_task_id = task_id
                         st.rerun()
-                with col7:
-                    if st.button("Delete", key=f"remove_task_{pet_name}_{idx}", help="Remove task", use_container_width=True):
+                with col4:
+                    if st.button("Delete", key=f"remove_task_{task_id}", help="Remove task", use_container_width=True):
                         if task.pet:
                             task.pet.remove_task(task)
+                        mark_owner_changed()
                         st.rerun()
 
-                if st.session_state.edit_task_id == task_id:
-                    st.caption("Edit task")
-                    edit_pet_options = {
-                        f"{pet.name} ({pet.type})": pet for pet in st.session_state.owner.pets
-                    }
-                    current_pet_label = next(
-                        (
-                            label
-                            for label, pet_obj in edit_pet_options.items()
-                            if pet_obj is task.pet
-                        ),
-                        next(iter(edit_pet_options.keys()))
+                if edit_task_id == task_id:
+                    render_edit_task_form(
+                        task, edit_pet_options, edit_pet_option_labels, edit_pet_positions
                     )
-                    edit_col1, edit_col2 = st.columns(2)
-                    with edit_col1:
-                        edit_desc = st.text_input(
-                            "Description",
-                            value=task.description or "",
-                            key=f"edit_desc_{task_id}"
-                        )
-                        edit_duration = st.number_input(
-                            "Duration (minutes)",
-                            min_value=1,
-                            max_value=300,
-                            value=int(task.duration) if task.duration else 30,
-                            key=f"edit_duration_{task_id}"
-                        )
-                        edit_time = st.text_input(
-                            "Scheduled Time (HH:MM)",
-                            value=task.time or "",
-                            key=f"edit_time_{task_id}",
-                            help="Optional - leave blank for unscheduled"
-                        )
-                    with edit_col2:
-                        edit_pet_label = st.selectbox(
-                            "Pet",
-                            list(edit_pet_options.keys()),
-                            index=list(edit_pet_options.keys()).index(current_pet_label),
-                            key=f"edit_pet_{task_id}"
-                        )
-                        edit_priority = st.selectbox(
-                            "Priority",
-                            ["LOW", "MEDIUM", "HIGH"],
-                            index={Priority.LOW: 0, Priority.MEDIUM: 1, Priority.HIGH: 2}[Priority(task.priority)],
-                            key=f"edit_priority_{task_id}"
-                        )
-                        edit_frequency = st.selectbox(
-                            "Frequency",
-                            ["once", "daily", "weekly"],
-                            index=["once", "daily", "weekly"].index(task.frequency if task.frequency in ["once", "daily", "weekly"] else "once"),
-                            key=f"edit_frequency_{task_id}"
-                        )
-
-                    save_col, cancel_col = st.columns(2)
-                    with save_col:
-                        if st.button("Save Changes", key=f"save_task_{task_id}", use_container_width=True):
-                            time_error, parsed_time = parse_task_time(edit_time)
-                            if time_error:
-                                st.error(time_error)
-                            elif not edit_desc.strip():
-                                st.error("Please enter a task description")
-                            else:
-                                priority_map = {"LOW": Priority.LOW, "MEDIUM": Priority.MEDIUM, "HIGH": Priority.HIGH}
-                                new_due_date = datetime.now() if edit_frequency in ["daily", "weekly"] else None
-                                new_pet = edit_pet_options[edit_pet_label]
-                                task.update_task(
-                                    description=edit_desc.strip(),
-                                    duration=edit_duration,
-                                    priority=priority_map[edit_priority],
-                                    frequency=edit_frequency,
-                                    time=parsed_time if parsed_time else None,
-                                    due_date=new_due_date
-                                )
-                                if task.pet is not new_pet:
-                                    if task.pet:
-                                        task.pet.remove_task(task)
-                                    new_pet.add_task(task)
-                                st.session_state.edit_task_id = None
-                                st.success("✅ Task updated")
-                                st.rerun()
-                    with cancel_col:
-                        if st.button("Cancel", key=f"cancel_task_{task_id}", use_container_width=True):
-                            st.session_state.edit_task_id = None
-                            st.rerun()
                 st.divider()
     else:
         st.info("No tasks match the current filters. Add tasks above!")
@@ -540,21 +653,27 @@ st.divider()
 # Schedule Generation Section
 # ============================================================================
 st.markdown('<p class="pawpal-section">📅 Generate Schedule</p>', unsafe_allow_html=True)
-scheduler_for_schedule = Scheduler(owner=st.session_state.owner)
+scheduler_for_schedule = st.session_state.scheduler
 
 col1, col2 = st.columns([1, 3])
 with col1:
     if st.button("Generate Schedule", type="primary", use_container_width=True):
         # Step 3: Wire UI actions to logic
-        st.session_state.schedule = scheduler_for_schedule.generate_schedule()
+        # Skip the scheduler when nothing has changed since the current schedule was built
+        if (
+            st.session_state.schedule is None
+            or st.session_state.get("schedule_fingerprint") != owner_fingerprint(owner)
+        ):
+            st.session_state.schedule = scheduler_for_schedule.generate_schedule()
+            st.session_state.schedule_fingerprint = owner_fingerprint(owner)
+            mark_owner_changed()
 
 with col2:
     if st.button("Clear Schedule", use_container_width=True):
         st.session_state.schedule = None
         # Reset all task statuses to pending
-        for pet in st.session_state.owner.pets:
-            for task in pet.tasks:
-                task.change_status("pending")
+        Task.bulk_set_status(owner.get_all_tasks(), "pending")
+        mark_owner_changed()
         st.rerun()
 
 # Display schedule
@@ -569,19 +688,24 @@ if st.session_state.schedule:
         st.subheader("✅ Scheduled Tasks")
         st.caption(f"Total time: {schedule['total_time_used']} minutes")
 
-        scheduled_task_objects = [entry["task"] for entry in schedule["scheduled_tasks"]]
-        schedule_conflicts = scheduler_for_schedule.detect_conflicts(scheduled_task_objects)
-        conflict_task_ids = {
-            id(conflict["task1"]) for conflict in schedule_conflicts
-        } | {
-            id(conflict["task2"]) for conflict in schedule_conflicts
-        }
+        schedule_conflicts = cached_until_owner_changes(
+            "schedule_conflicts",
+            lambda: scheduler_for_schedule.detect_conflicts(
+                [entry["task"] for entry in schedule["scheduled_tasks"]]
+            )
+        )
+        # One flag per scheduled row, indexed by position in the schedule
+        schedule_position = {entry["task"].uid: pos for pos, entry in enumerate(schedule["scheduled_tasks"])}
+        conflict_flags = bytearray(len(schedule["scheduled_tasks"]))
+        for conflict in schedule_conflicts:
+            conflict_flags[schedule_position[conflict["task1"].uid]] = 1
+            conflict_flags[schedule_position[conflict["task2"].uid]] = 1
 
         for i, scheduled_task in enumerate(schedule["scheduled_tasks"], 1):
             task = scheduled_task["task"]
             pet_name = scheduled_task.get("pet_name") or (task.pet.name if task.pet else "Unknown")
             is_completed = task.status == "completed"
-            has_conflict = id(task) in conflict_task_ids
+            has_conflict = conflict_flags[i - 1]
 
             with st.container():
                 row_title = f"{i}. {task.description} ({pet_name})"
@@ -591,7 +715,7 @@ if st.session_state.schedule:
                     row_title = f"~~{row_title}~~"
                 st.markdown(row_title)
 
-                col1, col2, col3, col4 = st.columns(4)
+                col1, col2, col3, col4 = st.columns(SCHEDULE_ROW_COLUMNS)
                 with col1:
                     time_text = f"⏰ {scheduled_task['time_range']}"
                     st.markdown(f"~~{time_text}~~" if is_completed else time_text)
@@ -599,18 +723,19 @@ if st.session_state.schedule:
                     duration_text = f"⏱️ {task.duration} minutes"
                     st.markdown(f"~~{duration_text}~~" if is_completed else duration_text)
                 with col3:
-                    priority_text = f"🎯 {Priority(task.priority).name} priority"
+                    priority_text = f"🎯 {_PRIORITY_NAMES[task.priority]} priority"
                     st.markdown(f"~~{priority_text}~~" if is_completed else priority_text)
                 with col4:
                     if not is_completed:
-                        if st.button("✅ Complete", key=f"schedule_complete_{id(task)}", use_container_width=True):
-                            if task.frequency in ["daily", "weekly"]:
+                        if st.button("✅ Complete", key=f"schedule_complete_{task.uid}", use_container_width=True):
+                            if task.frequency in RECURRING_FREQUENCIES:
                                 task.mark_complete()
                             else:
                                 task.change_status("completed")
 
                             if task.pet:
                                 task.pet.remove_task(task)
+                            mark_owner_changed()
                             st.rerun()
 
                 reason_text = f"📝 {scheduled_task['reason']}"
@@ -633,7 +758,7 @@ if st.session_state.schedule:
     with col2:
         st.metric("Skipped", f"{len(schedule['skipped_tasks'])} tasks")
     with col3:
-        st.metric("Time Used", f"{schedule['total_time_used']} / {st.session_state.owner.available_time_minutes} min")
+        st.metric("Time Used", f"{schedule['total_time_used']} / {owner.available_time_minutes} min")
 
 else:
     st.info("👆 Click 'Generate Schedule' to create your daily pet care plan!")
@@ -1,6 +1,11 @@
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from enum import IntEnum
+from itertools import chain
+from operator import attrgetter
+import sys
+import uuid
 from datetime import datetime, timedelta
 
 
@@ -11,69 +16,191 @@ class Priority(IntEnum):
     HIGH = 3
 
 
-@dataclass
+# Display name for each priority value
+_PRIORITY_NAMES = {int(p): p.name for p in Priority}
+
+# Valid task statuses. Statuses are interned on assignment, so the usual `==`
+# comparison hits the identity shortcut.
+_PENDING = sys.intern("pending")
+_SCHEDULED = sys.intern("scheduled")
+_COMPLETED = sys.intern("completed")
+_SKIPPED = sys.intern("skipped")
+_VALID_STATUSES = frozenset({_PENDING, _SCHEDULED, _COMPLETED, _SKIPPED})
+
+# Gap until the next occurrence of each recurring frequency
+_RECURRENCE_INTERVALS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1)
+}
+
+# Start of each preferred time window (in minutes from midnight)
+_TIME_WINDOWS = {
+    "morning": 360,     # 6:00 AM
+    "afternoon": 720,   # 12:00 PM (noon)
+    "evening": 1080     # 6:00 PM
+}
+_DEFAULT_START_TIME = 480  # 8:00 AM, used when no known window is preferred
+_MINUTES_PER_DAY = 24 * 60
+
+# Preformatted "HH:MM" label for every minute of the day
+_HHMM = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(_MINUTES_PER_DAY))
+
+
+def _hhmm_to_minutes(time_str: str) -> int:
+    """Convert an "HH:MM" string to minutes from midnight"""
+    if len(time_str) == 5 and time_str[2] == ":":
+        digits = time_str[:2] + time_str[3:]
+        if digits.isascii() and digits.isdigit():
+            # Well-formed fixed-width fast path: read the four digits directly
+            return (
+                (ord(time_str[0]) - 48) * 600 + (ord(time_str[1]) - 48) * 60
+                + (ord(time_str[3]) - 48) * 10 + (ord(time_str[4]) - 48)
+            )
+    # Anything else goes through int() parsing, which raises ValueError on malformed input
+    hours, minutes = map(int, time_str.split(":"))
+    return hours * 60 + minutes
+
+
+# Message templates used by Scheduler.generate_schedule for every task it places or skips
+_TIME_RANGE_TMPL = "%s - %s"
+_REASON_TMPL = "Priority: %s, Duration: %smin, Pet: %s"
+_FIXED_REASON_TMPL = "Fixed time: %s, " + _REASON_TMPL
+_SKIP_TMPL = "Insufficient total available time (%smin remaining, %smin needed)"
+_NO_SLOT_TMPL = "Insufficient time remaining (%smin available, %smin needed)"
+
+
+@dataclass(slots=True, eq=False)
 class Owner:
-    """Manages multiple pets and provides access to all their tasks"""
+    """
+    Manages multiple pets and provides access to all their tasks.
+
+    Change `pets` only through add_pet()/remove_pet(), and each pet's `tasks` only
+    through Pet.add_task()/remove_task(); the cached task list is not refreshed
+    after direct list mutation.
+    """
     name: Optional[str] = None
     preferences: Dict = field(default_factory=dict)
     pets: List['Pet'] = field(default_factory=list)
     available_time_minutes: int = 480  # Default 8 hours per day
+    # Flat list of every pet's tasks, rebuilt lazily after pets or tasks change
+    _all_tasks: Optional[List['Task']] = field(default=None, init=False, repr=False, compare=False)
+    # Normalized (name, type) keys of owned pets, rebuilt lazily after pets change
+    _pet_keys: Optional[Set[Tuple[str, str]]] = field(default=None, init=False, repr=False, compare=False)
+    # Every pet in `pets`, for O(1) membership checks (pets hash by identity)
+    _pet_set: Set['Pet'] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index any pets passed to the constructor and link them back to this owner"""
+        self._pet_set = set(self.pets)
+        for pet in self.pets:
+            pet.owner = self
 
     def add_pet(self, pet: 'Pet') -> None:
         """Add a pet to this owner's list of pets"""
-        if pet not in self.pets:
+        if pet not in self._pet_set:
+            self._pet_set.add(pet)
             self.pets.append(pet)
             pet.owner = self
+            self._pet_keys = None
+            self._invalidate_tasks()
 
     def remove_pet(self, pet: 'Pet') -> None:
         """Remove a pet from this owner's list of pets"""
-        if pet in self.pets:
+        if pet in self._pet_set:
+            self._pet_set.discard(pet)
             self.pets.remove(pet)
             pet.owner = None
+            self._pet_keys = None
+            self._invalidate_tasks()
+
+    def has_pet(self, name: str, pet_type: str) -> bool:
+        """Check whether a pet with this name and type (case-insensitive) is already owned"""
+        if self._pet_keys is None:
+            self._pet_keys = {
+                (pet.name.strip().lower(), pet.type.strip().lower())
+                for pet in self.pets
+                if pet.name and pet.type
+            }
+        return (name.strip().lower(), pet_type.strip().lower()) in self._pet_keys
+
+    def _invalidate_tasks(self) -> None:
+        """Drop the cached task list so the next get_all_tasks() rebuilds it"""
+        self._all_tasks = None
 
     def get_all_tasks(self, pet: Optional['Pet'] = None) -> List['Task']:
-        """Get all tasks across all pets, or tasks for a specific pet if provided"""
+        """
+        Get all tasks across all pets, or tasks for a specific pet if provided.
+
+        The returned list is shared (cached on the owner), so callers should not mutate it.
+        """
         if pet is not None:
             # Return tasks for the specified pet only
-            if pet in self.pets:
+            if pet in self._pet_set:
                 return pet.tasks
             else:
                 return []  # Pet not owned by this owner
         else:
-            # Return all tasks from all pets
-            all_tasks = []
-            for pet in self.pets:
-                all_tasks.extend(pet.tasks)
-            return all_tasks
+            # Return all tasks from all pets, rebuilding the flat list only when stale
+            if self._all_tasks is None:
+                self._all_tasks = list(chain.from_iterable(pet.tasks for pet in self.pets))
+            return self._all_tasks
+
+    def get_pending_tasks(self) -> List['Task']:
+        """
+        Get all pending tasks across all pets.
+
+        Statuses are public fields that can be assigned directly, so this is
+        filtered fresh on every call rather than cached.
+        """
+        return [task for task in self.get_all_tasks() if task.status == _PENDING]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Pet:
-    """Stores pet details and a list of tasks"""
+    """
+    Stores pet details and a list of tasks.
+
+    Change `tasks` only through add_task()/remove_task(), so the owner's cached
+    task list and the membership set stay in sync.
+    """
     name: Optional[str] = None
     age: Optional[int] = None
     type: Optional[str] = None
     owner: Optional['Owner'] = None
     tasks: List['Task'] = field(default_factory=list)
+    # Every task in `tasks`, for O(1) membership checks (tasks hash by identity)
+    _task_set: Set['Task'] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index any tasks passed to the constructor and link them back to this pet"""
+        self._task_set = set(self.tasks)
+        for task in self.tasks:
+            task.pet = self
 
     def add_task(self, task: 'Task') -> None:
         """Add a task to this pet's task list"""
-        if task not in self.tasks:
+        if task not in self._task_set:
+            self._task_set.add(task)
             self.tasks.append(task)
             task.pet = self
+            if self.owner:
+                self.owner._invalidate_tasks()
 
     def remove_task(self, task: 'Task') -> None:
         """Remove a task from this pet's task list"""
-        if task in self.tasks:
+        if task in self._task_set:
+            self._task_set.discard(task)
             self.tasks.remove(task)
             task.pet = None
+            if self.owner:
+                self.owner._invalidate_tasks()
 
     def get_pending_tasks(self) -> List['Task']:
         """Get all pending tasks for this pet"""
-        return [task for task in self.tasks if task.status == "pending"]
+        return [task for task in self.tasks if task.status == _PENDING]
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     """Represents a single activity (description, time, frequency, completion status)"""
     description: Optional[str] = None
@@ -84,20 +211,62 @@ class Task:
     pet: Optional['Pet'] = None
     time: Optional[str] = None  # Scheduled time in "HH:MM" format (e.g., "09:30")
     due_date: Optional[datetime] = None  # Due date for recurring tasks
+    uid: str = field(default_factory=lambda: uuid.uuid4().hex, init=False, compare=False)  # Stable UI/session key
+    # `time` as minutes from midnight (infinity when unscheduled, None when `time` is
+    # malformed), kept in sync with `time`
+    _time_minutes: Optional[float] = field(default=float("inf"), init=False, repr=False, compare=False)
+    # The `time` value `_time_minutes` was computed from, to catch direct `task.time = ...` writes
+    _time_src: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # (-priority, duration) ordering key for flexible scheduling, kept in sync with both fields
+    _sort_key: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    # The (priority, duration) values `_sort_key` was computed from, to catch direct writes
+    _sort_src: Tuple = field(default=(None, None), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern the status and precompute the numeric time and priority sort key"""
+        self.status = sys.intern(self.status)
+        self._sync_time_minutes()
+        self._sync_sort_key()
+
+    def _sync_sort_key(self) -> None:
+        """Recompute the cached priority sort key after `priority` or `duration` changes"""
+        self._sort_src = (self.priority, self.duration)
+        self._sort_key = (-self.priority, self.duration if self.duration else 0)
+
+    def _sync_time_minutes(self) -> None:
+        """Recompute the cached minutes-from-midnight value after `time` changes"""
+        self._time_src = self.time
+        if self.time is None:
+            self._time_minutes = float("inf")
+            return
+        try:
+            self._time_minutes = _hhmm_to_minutes(self.time)
+        except ValueError:
+            # Keep construction/updates lenient; the error surfaces when the time is used
+            self._time_minutes = None
+
+    def _refresh_cached_keys(self) -> None:
+        """Re-sync cached keys whose source fields were assigned directly"""
+        if self.time is not self._time_src:
+            self._sync_time_minutes()
+        priority_src, duration_src = self._sort_src
+        if self.priority is not priority_src or self.duration is not duration_src:
+            self._sync_sort_key()
 
     def change_status(self, new_status: str) -> None:
         """Change the status of this task"""
-        match new_status:
-            case "completed":
-                self.status = "completed"
-            case "scheduled":
-                self.status = "scheduled"
-            case "skipped":
-                self.status = "skipped"
-            case "pending":
-                self.status = "pending"
-            case _:
-                raise ValueError(f"Invalid status: {new_status}. Must be 'pending', 'scheduled', 'completed', or 'skipped'.")
+        if new_status not in _VALID_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}. Must be 'pending', 'scheduled', 'completed', or 'skipped'.")
+        self.status = sys.intern(new_status)
+
+    @staticmethod
+    def bulk_set_status(tasks: List['Task'], new_status: str) -> None:
+        """Set the same status on many tasks, validating the status only once"""
+        if new_status not in _VALID_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}. Must be 'pending', 'scheduled', 'completed', or 'skipped'.")
+        new_status = sys.intern(new_status)
+        for task in tasks:
+            task.status = new_status
 
     def update_task(self, description: Optional[str] = None,
                     duration: Optional[int] = None,
@@ -112,10 +281,13 @@ class Task:
             self.duration = duration
         if priority is not None:
             self.priority = priority
+        if duration is not None or priority is not None:
+            self._sync_sort_key()
         if frequency is not None:
             self.frequency = frequency
         if time is not ...:
             self.time = time
+            self._sync_time_minutes()
         if due_date is not ...:
             self.due_date = due_date
 
@@ -127,24 +299,21 @@ class Task:
         Returns:
             New task instance if recurring, None otherwise
         """
-        self.change_status("completed")
+        self.change_status(_COMPLETED)
 
         # Handle recurring tasks
-        if self.frequency in ["daily", "weekly"]:
+        recurrence_interval = _RECURRENCE_INTERVALS.get(self.frequency)
+        if recurrence_interval is not None:
             # Calculate next due date
             current_due = self.due_date if self.due_date else datetime.now()
-
-            if self.frequency == "daily":
-                next_due_date = current_due + timedelta(days=1)
-            else:  # weekly
-                next_due_date = current_due + timedelta(weeks=1)
+            next_due_date = current_due + recurrence_interval
 
             # Create new task instance for next occurrence
             new_task = Task(
                 description=self.description,
                 duration=self.duration,
                 priority=self.priority,
-                status="pending",
+                status=_PENDING,
                 frequency=self.frequency,
                 pet=self.pet,
                 time=self.time,
@@ -160,6 +329,26 @@ class Task:
         return None
 
 
+# Sweep-line event kinds for detect_conflicts, in the order they apply within one minute
+_END_EVENT, _POINT_EVENT, _START_EVENT = 0, 1, 2
+
+_BY_TIME_MINUTES = attrgetter("_time_minutes")
+_BY_PRIORITY_SORT_KEY = attrgetter("_sort_key")
+
+
+def _refresh_cached_keys(tasks: List[Task]) -> None:
+    """Bring every task's cached sort keys up to date before they are read"""
+    for task in tasks:
+        task._refresh_cached_keys()
+
+
+def _require_parsed_times(tasks: List[Task]) -> None:
+    """Raise ValueError for the first task whose `time` could not be parsed"""
+    for task in tasks:
+        if task._time_minutes is None:
+            _hhmm_to_minutes(task.time)
+
+
 class Scheduler:
     """The 'Brain' that retrieves, organizes, and manages tasks across pets"""
 
@@ -186,9 +375,8 @@ class Scheduler:
             }
 
         # Get all pending tasks from all pets
-        all_tasks = []
-        for pet in self.owner.pets:
-            all_tasks.extend(pet.get_pending_tasks())
+        all_tasks = self.owner.get_pending_tasks()
+        _refresh_cached_keys(all_tasks)
 
         if not all_tasks:
             return {
@@ -201,23 +389,28 @@ class Scheduler:
         # Schedule tasks with a total-time budget.
         # Preferred time window is used as a starting preference for flexible tasks only.
         scheduled_tasks = []
+        scheduled_starts = []  # Start minute of each scheduled entry, so entries stay ordered by start time
         skipped_tasks = []
         preferred_start_time = self._get_start_time()
         available_time_minutes = self._calculate_total_available_time()
         remaining_time_minutes = available_time_minutes
         total_time_used = 0
-        occupied_intervals = []  # Tuples of (start_minutes, end_minutes)
-        day_end_time = 24 * 60
+        occupied_intervals = []  # Tuples of (start_minutes, end_minutes), kept sorted by start
+        day_end_time = _MINUTES_PER_DAY
+        occupied_day_minutes = 0  # Scheduled minutes that fall before midnight
 
         # Handle fixed-time tasks first, so explicit user times are honored.
-        fixed_time_tasks = [task for task in all_tasks if task.time is not None]
-        flexible_tasks = [task for task in all_tasks if task.time is None]
+        fixed_time_tasks = []
+        flexible_tasks = []
+        for task in all_tasks:
+            if task.time is not None:
+                fixed_time_tasks.append(task)
+            else:
+                flexible_tasks.append(task)
 
         # Stable order: earlier time first, then higher priority.
-        fixed_time_tasks = sorted(
-            fixed_time_tasks,
-            key=lambda t: (self._time_to_minutes(t.time), -t.priority)
-        )
+        _require_parsed_times(fixed_time_tasks)
+        fixed_time_tasks.sort(key=lambda t: (t._time_minutes, -t.priority))
 
         for task in fixed_time_tasks:
             if task.duration is None or task.duration <= 0:
@@ -230,34 +423,34 @@ class Scheduler:
             if task.duration > remaining_time_minutes:
                 skipped_tasks.append({
                     "task": task,
-                    "reason": (
-                        f"Insufficient total available time ({remaining_time_minutes}min remaining, "
-                        f"{task.duration}min needed)"
-                    )
+                    "reason": _SKIP_TMPL % (remaining_time_minutes, task.duration)
                 })
-                task.change_status("skipped")
+                task.change_status(_SKIPPED)
                 continue
 
-            task_start_time = self._time_to_minutes(task.time)
+            task_start_time = task._time_minutes
             task_end_time = task_start_time + task.duration
 
-            priority_label = Priority(task.priority).name
+            priority_label = _PRIORITY_NAMES.get(task.priority, "UNKNOWN")
             pet_name = task.pet.name if task.pet else "unknown pet"
 
-            scheduled_tasks.append({
+            # Keep output consistently ordered by actual start time.
+            position = bisect_right(scheduled_starts, task_start_time)
+            scheduled_starts.insert(position, task_start_time)
+            scheduled_tasks.insert(position, {
                 "task": task,
                 "pet_name": pet_name,
                 "start_time_minutes": task_start_time,
                 "end_time_minutes": task_end_time,
-                "time_range": f"{self._format_time(task_start_time)} - {self._format_time(task_end_time)}",
-                "reason": f"Fixed time: {task.time}, Priority: {priority_label}, Duration: {task.duration}min, Pet: {pet_name}"
+                "time_range": _TIME_RANGE_TMPL % (self._format_time(task_start_time), self._format_time(task_end_time)),
+                "reason": _FIXED_REASON_TMPL % (task.time, priority_label, task.duration, pet_name)
             })
 
-            occupied_intervals.append((task_start_time, task_end_time))
-            occupied_intervals.sort(key=lambda interval: interval[0])
+            insort(occupied_intervals, (task_start_time, task_end_time))
+            occupied_day_minutes += max(0, min(task_end_time, day_end_time) - task_start_time)
             remaining_time_minutes -= task.duration
             total_time_used += task.duration
-            task.change_status("scheduled")
+            task.change_status(_SCHEDULED)
 
         # Schedule flexible tasks by priority in remaining gaps.
         sorted_flexible_tasks = self._sort_tasks_by_priority(flexible_tasks)
@@ -273,12 +466,9 @@ class Scheduler:
             if task.duration > remaining_time_minutes:
                 skipped_tasks.append({
                     "task": task,
-                    "reason": (
-                        f"Insufficient total available time ({remaining_time_minutes}min remaining, "
-                        f"{task.duration}min needed)"
-                    )
+                    "reason": _SKIP_TMPL % (remaining_time_minutes, task.duration)
                 })
-                task.change_status("skipped")
+                task.change_status(_SKIPPED)
                 continue
 
             task_start_time = self._find_available_slot(
@@ -300,37 +490,32 @@ class Scheduler:
             if task_start_time is not None:
                 task_end_time = task_start_time + task.duration
 
-                priority_label = Priority(task.priority).name
+                priority_label = _PRIORITY_NAMES.get(task.priority, "UNKNOWN")
                 pet_name = task.pet.name if task.pet else "unknown pet"
 
-                scheduled_tasks.append({
+                position = bisect_right(scheduled_starts, task_start_time)
+                scheduled_starts.insert(position, task_start_time)
+                scheduled_tasks.insert(position, {
                     "task": task,
                     "pet_name": pet_name,
                     "start_time_minutes": task_start_time,
                     "end_time_minutes": task_end_time,
-                    "time_range": f"{self._format_time(task_start_time)} - {self._format_time(task_end_time)}",
-                    "reason": f"Priority: {priority_label}, Duration: {task.duration}min, Pet: {pet_name}"
+                    "time_range": _TIME_RANGE_TMPL % (self._format_time(task_start_time), self._format_time(task_end_time)),
+                    "reason": _REASON_TMPL % (priority_label, task.duration, pet_name)
                 })
 
-                occupied_intervals.append((task_start_time, task_end_time))
-                occupied_intervals.sort(key=lambda interval: interval[0])
+                insort(occupied_intervals, (task_start_time, task_end_time))
+                occupied_day_minutes += max(0, min(task_end_time, day_end_time) - task_start_time)
                 remaining_time_minutes -= task.duration
                 total_time_used += task.duration
-                task.change_status("scheduled")
+                task.change_status(_SCHEDULED)
             else:
-                remaining = self._calculate_free_time(
-                    occupied_intervals, 0, day_end_time
-                )
+                remaining = max(0, day_end_time - occupied_day_minutes)
                 skipped_tasks.append({
                     "task": task,
-                    "reason": (
-                        f"Insufficient time remaining ({remaining}min available, {task.duration}min needed)"
-                    )
+                    "reason": _NO_SLOT_TMPL % (remaining, task.duration)
                 })
-                task.change_status("skipped")
-
-        # Keep output consistently ordered by actual start time.
-        scheduled_tasks.sort(key=lambda item: item["start_time_minutes"])
+                task.change_status(_SKIPPED)
 
         # Generate explanation
         explanation = self._generate_explanation(
@@ -353,24 +538,16 @@ class Scheduler:
     def _get_start_time(self) -> int:
         """Get start time based on owner preferences (morning/afternoon/evening)"""
         if not self.owner or not self.owner.preferences:
-            return 480  # Default to 8:00 AM
-
-        # Check for preferred_time_window preference
-        time_window = self.owner.preferences.get("preferred_time_window", "").lower()
-
-        # Define time windows (in minutes from midnight)
-        time_windows = {
-            "morning": 360,     # 6:00 AM
-            "afternoon": 720,   # 12:00 PM (noon)
-            "evening": 1080     # 6:00 PM
-        }
+            return _DEFAULT_START_TIME
 
         # Return the start time for the preferred window, or 8:00 AM if not found
-        return time_windows.get(time_window, 480)
+        time_window = self.owner.preferences.get("preferred_time_window", "").lower()
+        return _TIME_WINDOWS.get(time_window, _DEFAULT_START_TIME)
 
     def _sort_tasks_by_priority(self, tasks: List[Task]) -> List[Task]:
         """Sort tasks by priority (HIGH to LOW), then by duration (shorter first)"""
-        return sorted(tasks, key=lambda t: (-t.priority, t.duration if t.duration else 0))
+        _refresh_cached_keys(tasks)
+        return sorted(tasks, key=_BY_PRIORITY_SORT_KEY)
 
     def _can_fit_task(self, task: Task, remaining_time: int) -> bool:
         """Check if a task can fit in the remaining available time"""
@@ -380,23 +557,31 @@ class Scheduler:
 
     def _format_time(self, minutes: int) -> str:
         """Convert minutes from start of day to HH:MM format"""
+        if 0 <= minutes < len(_HHMM):
+            return _HHMM[minutes]
+        # Past midnight (e.g., a task ending after 24:00): keep counting hours
         hours = minutes // 60
         mins = minutes % 60
         return f"{hours:02d}:{mins:02d}"
 
     def _time_to_minutes(self, time_str: str) -> int:
         """Convert a time string in HH:MM format to minutes from midnight."""
-        hours, minutes = map(int, time_str.split(":"))
-        return hours * 60 + minutes
+        return _hhmm_to_minutes(time_str)
 
     def _find_available_slot(self, duration: int, intervals: List[tuple],
                              window_start: int, window_end: int) -> Optional[int]:
-        """Find earliest available slot of `duration` in [window_start, window_end)."""
+        """Find earliest available slot of `duration` in [window_start, window_end).
+
+        `intervals` must already be sorted by start time.
+        """
         cursor = window_start
 
-        for start, end in sorted(intervals, key=lambda interval: interval[0]):
+        for start, end in intervals:
             if cursor + duration <= start:
                 return cursor
+            if start >= window_end:
+                # Later intervals start even further past the window
+                break
             if end > cursor:
                 cursor = end
 
@@ -405,16 +590,6 @@ class Scheduler:
 
         return None
 
-    def _calculate_free_time(self, intervals: List[tuple], window_start: int, window_end: int) -> int:
-        """Calculate total free minutes in the scheduling window."""
-        occupied_time = 0
-        for start, end in intervals:
-            clamped_start = max(start, window_start)
-            clamped_end = min(end, window_end)
-            if clamped_start < clamped_end:
-                occupied_time += (clamped_end - clamped_start)
-        return max(0, (window_end - window_start) - occupied_time)
-
     def _generate_explanation(self, scheduled_tasks: List[Dict],
                             skipped_tasks: List[Dict],
                             available_time: int,
@@ -451,7 +626,8 @@ class Scheduler:
     def sort_by_time(self, tasks: List[Task]) -> List[Task]:
         """
         Sort tasks by their scheduled time in "HH:MM" format.
-        Tasks without a time are placed at the end.
+        Tasks whose time cannot be parsed follow the parsed ones (in string order),
+        and tasks without a time are placed at the end.
 
         Args:
             tasks: List of Task objects to sort
@@ -459,15 +635,17 @@ class Scheduler:
         Returns:
             Sorted list of tasks by time
         """
-        # Separate tasks with and without time
-        tasks_with_time = [t for t in tasks if t.time is not None]
-        tasks_without_time = [t for t in tasks if t.time is None]
+        _refresh_cached_keys(tasks)
 
-        # Sort tasks with time using lambda to compare time strings
-        sorted_with_time = sorted(tasks_with_time, key=lambda t: t.time)
+        # Tasks without a time have an infinite key, so the stable sort keeps
+        # them at the end in their original order
+        ordered = sorted((t for t in tasks if t._time_minutes is not None), key=_BY_TIME_MINUTES)
+        if len(ordered) == len(tasks):
+            return ordered
 
-        # Return sorted tasks with time first, then tasks without time
-        return sorted_with_time + tasks_without_time
+        unparsed = sorted((t for t in tasks if t._time_minutes is None), key=attrgetter("time"))
+        first_untimed = bisect_left(ordered, float("inf"), key=_BY_TIME_MINUTES)
+        return ordered[:first_untimed] + unparsed + ordered[first_untimed:]
 
     def filter_tasks(self, tasks: List[Task], pet_name: Optional[str] = None,
                     status: Optional[str] = None) -> List[Task]:
@@ -486,11 +664,18 @@ class Scheduler:
 
         # Filter by pet name if specified
         if pet_name is not None:
-            filtered = [t for t in filtered if t.pet and t.pet.name.lower() == pet_name.lower()]
+            # Casefold the target once and each distinct pet's name once, not once per task
+            target = pet_name.casefold()
+            pet_matches: Dict[Pet, bool] = {}
+            for t in filtered:
+                if t.pet and t.pet not in pet_matches:
+                    pet_matches[t.pet] = t.pet.name.casefold() == target
+            filtered = [t for t in filtered if pet_matches.get(t.pet)]
 
         # Filter by status if specified
         if status is not None:
-            filtered = [t for t in filtered if t.status == status.lower()]
+            wanted_status = status.lower()
+            filtered = [t for t in filtered if t.status == wanted_status]
 
         return filtered
 
@@ -498,6 +683,7 @@ class Scheduler:
         """
         Detect if any tasks have conflicting scheduled times.
         A conflict occurs when two tasks have overlapping time windows.
+        Uses a sorted sweep over start/end/point events instead of comparing every pair.
 
         Args:
             tasks: List of Task objects to check for conflicts
@@ -506,42 +692,72 @@ class Scheduler:
             List of conflict dictionaries with 'task1', 'task2', and 'message'
         """
         conflicts = []
+        _refresh_cached_keys(tasks)
 
         # Only check tasks that have both time and duration set
         tasks_with_time = [t for t in tasks if t.time is not None and t.duration is not None]
+        if len(tasks_with_time) < 2:
+            return conflicts
+
+        # Two tasks overlap when each starts strictly before the other ends.
+        # Sweep line over the sorted events; at the same minute, end events come
+        # first, then zero-length points, then starts, so back-to-back tasks do not
+        # overlap while a point strictly inside an open task does.
+        events = []
+        reversed_spans = []  # (idx, start, end) of tasks with a negative duration
+        for idx, task in enumerate(tasks_with_time):
+            start = task._time_minutes
+            if start is None:
+                start = _hhmm_to_minutes(task.time)  # raises ValueError for a malformed time
+            end = start + task.duration
+            if task.duration > 0:
+                events.append((start, _START_EVENT, idx))
+                events.append((end, _END_EVENT, idx))
+            elif task.duration == 0:
+                events.append((start, _POINT_EVENT, idx))
+            else:
+                reversed_spans.append((idx, start, end))
+        events.sort()
+
+        # Every task still open at a start or point event overlaps with it
+        open_ids = set()
+        spans = {}  # idx -> (start, end) of every positive-duration task
+        overlapping_pairs = []
+        for minute, kind, idx in events:
+            if kind == _END_EVENT:
+                open_ids.discard(idx)
+                continue
+            for other_idx in open_ids:
+                overlapping_pairs.append((min(idx, other_idx), max(idx, other_idx)))
+            if kind == _START_EVENT:
+                open_ids.add(idx)
+                spans[idx] = (minute, minute + tasks_with_time[idx].duration)
+
+        # A negative duration can only overlap a positive-duration task, via the
+        # same strict comparison; such tasks are rare enough to check directly
+        for idx, start, end in reversed_spans:
+            for other_idx, (other_start, other_end) in spans.items():
+                if start < other_end and other_start < end:
+                    overlapping_pairs.append((min(idx, other_idx), max(idx, other_idx)))
+
+        # Report pairs in input order, matching the order tasks were given
+        overlapping_pairs.sort()
+
+        for i, j in overlapping_pairs:
+            task1 = tasks_with_time[i]
+            task2 = tasks_with_time[j]
+            pet1_name = task1.pet.name if task1.pet else "Unknown"
+            pet2_name = task2.pet.name if task2.pet else "Unknown"
+
+            conflict_message = (
+                f"⚠️ CONFLICT: '{task1.description}' ({pet1_name}) at {task1.time} "
+                f"overlaps with '{task2.description}' ({pet2_name}) at {task2.time}"
+            )
 
-        # Helper function to convert "HH:MM" to minutes from midnight
-        def time_to_minutes(time_str: str) -> int:
-            hours, minutes = map(int, time_str.split(':'))
-            return hours * 60 + minutes
-
-        # Check each pair of tasks for overlap
-        for i in range(len(tasks_with_time)):
-            for j in range(i + 1, len(tasks_with_time)):
-                task1 = tasks_with_time[i]
-                task2 = tasks_with_time[j]
-
-                # Calculate start and end times in minutes
-                task1_start = time_to_minutes(task1.time)
-                task1_end = task1_start + task1.duration
-
-                task2_start = time_to_minutes(task2.time)
-                task2_end = task2_start + task2.duration
-
-                # Check for overlap: tasks overlap if one starts before the other ends
-                if task1_start < task2_end and task2_start < task1_end:
-                    pet1_name = task1.pet.name if task1.pet else "Unknown"
-                    pet2_name = task2.pet.name if task2.pet else "Unknown"
-
-                    conflict_message = (
-                        f"⚠️ CONFLICT: '{task1.description}' ({pet1_name}) at {task1.time} "
-                        f"overlaps with '{task2.description}' ({pet2_name}) at {task2.time}"
-                    )
-
-                    conflicts.append({
-                        'task1': task1,
-                        'task2': task2,
-                        'message': conflict_message
-                    })
+            conflicts.append({
+                'task1': task1,
+                'task2': task2,
+                'message': conflict_message
+            })
 
         return conflicts
@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the repository root importable for the test modules."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
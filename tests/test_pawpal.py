@@ -1,24 +1,42 @@
 """Comprehensive tests for PawPal+ domain and scheduler logic."""
 
 from datetime import datetime
-from pathlib import Path
-import sys
+import pickle
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from pawpal_system import Owner, Pet, Priority, Scheduler, Task
 
+# Treat deprecations as failures across the whole module, configured once here
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
+HIGH, MEDIUM, LOW = Priority.HIGH, Priority.MEDIUM, Priority.LOW
+
+
+def entries_by_task(entries):
+    """Index schedule entries by their task (tasks hash by identity)"""
+    return {item["task"]: item for item in entries}
+
+
+@pytest.fixture
+def owner():
+    """A fresh owner for tests that add pets and tasks"""
+    return Owner(name="Alex")
 
-def test_owner_add_remove_pet_and_get_all_tasks_filters_correctly():
-    owner = Owner(name="Alex")
+
+@pytest.fixture(scope="module")
+def scheduler():
+    """A scheduler over a pet-less owner, shared by tests that only call its pure helpers"""
+    return Scheduler(owner=Owner(name="Alex"))
+
+
+def test_owner_add_remove_pet_and_get_all_tasks_filters_correctly(owner):
     dog = Pet(name="Buddy", age=3, type="Dog")
     cat = Pet(name="Milo", age=2, type="Cat")
 
-    walk = Task(description="Walk", duration=30, priority=Priority.HIGH)
-    feed = Task(description="Feed", duration=10, priority=Priority.MEDIUM)
-    groom = Task(description="Groom", duration=20, priority=Priority.LOW)
+    walk = Task(description="Walk", duration=30, priority=HIGH)
+    feed = Task(description="Feed", duration=10, priority=MEDIUM)
+    groom = Task(description="Groom", duration=20, priority=LOW)
     dog.add_task(walk)
     dog.add_task(feed)
     cat.add_task(groom)
@@ -35,18 +53,83 @@ def test_owner_add_remove_pet_and_get_all_tasks_filters_correctly():
     outsider = Pet(name="Outside", age=1, type="Bird")
     assert owner.get_all_tasks(outsider) == []
 
+    assert owner.has_pet(" buddy ", "DOG")
+    assert not owner.has_pet("Buddy", "Cat")
+
     owner.remove_pet(cat)
     assert cat.owner is None
     assert owner.pets == [dog]
+    assert not owner.has_pet("Milo", "Cat")
+
+
+def test_owner_get_all_tasks_refreshes_after_pet_and_task_changes(owner):
+    dog = Pet(name="Buddy", age=3, type="Dog")
+    owner.add_pet(dog)
+    walk = Task(description="Walk", duration=30, frequency="daily", due_date=datetime(2026, 1, 1))
+    dog.add_task(walk)
+
+    assert owner.get_all_tasks() == [walk]
+    assert owner.get_all_tasks() is owner.get_all_tasks()
+
+    assert owner.get_pending_tasks() == [walk]
+
+    next_walk = walk.mark_complete()
+    assert owner.get_all_tasks() == [walk, next_walk]
+    assert owner.get_pending_tasks() == [next_walk]
+
+    Task.bulk_set_status([walk], "pending")
+    assert owner.get_pending_tasks() == [walk, next_walk]
+
+    dog.remove_task(walk)
+    assert owner.get_all_tasks() == [next_walk]
+
+    owner.remove_pet(dog)
+    assert owner.get_all_tasks() == []
+
+
+def test_owner_constructed_with_pets_refreshes_cached_tasks():
+    dog = Pet(name="Buddy", age=3, type="Dog")
+    owner = Owner(name="Alex", pets=[dog])
+    assert dog.owner is owner
+    assert owner.get_all_tasks() == []
+
+    walk = Task(description="Walk", duration=10)
+    dog.add_task(walk)
+    assert owner.get_all_tasks() == [walk]
+
+    schedule = Scheduler(owner=owner).generate_schedule()
+    assert [item["task"] for item in schedule["scheduled_tasks"]] == [walk]
+
+
+def test_owner_constructed_with_pets_refreshes_pending_tasks_after_status_changes():
+    dog = Pet(name="Buddy", age=3, type="Dog")
+    owner = Owner(name="Alex", pets=[dog])
+    walk = Task(description="Walk", duration=10, frequency="daily", due_date=datetime(2026, 1, 1))
+    dog.add_task(walk)
+    assert owner.get_pending_tasks() == [walk]
+
+    walk.change_status("scheduled")
+    assert owner.get_pending_tasks() == []
+
+    Task.bulk_set_status([walk], "pending")
+    assert owner.get_pending_tasks() == [walk]
+
+    next_walk = walk.mark_complete()
+    assert owner.get_pending_tasks() == [next_walk]
+
+    # A direct status write is seen too, so the scheduler skips the completed task
+    next_walk.status = "completed"
+    assert owner.get_pending_tasks() == []
+    assert Scheduler(owner=owner).generate_schedule()["explanation"] == "No pending tasks to schedule."
 
 
 def test_pet_add_remove_and_get_pending_tasks():
     pet = Pet(name="Buddy", age=3, type="Dog")
-    pending = Task(description="Pending", duration=15, priority=Priority.HIGH)
+    pending = Task(description="Pending", duration=15, priority=HIGH)
     completed = Task(
         description="Completed",
         duration=5,
-        priority=Priority.LOW,
+        priority=LOW,
         status="completed",
     )
 
@@ -59,20 +142,83 @@ def test_pet_add_remove_and_get_pending_tasks():
     assert completed.pet is pet
     assert pet.get_pending_tasks() == [pending]
 
+    # The pending list follows status changes in both directions
+    pending.change_status("scheduled")
+    assert pet.get_pending_tasks() == []
+    completed.change_status("pending")
+    assert pet.get_pending_tasks() == [completed]
+    Task.bulk_set_status(pet.tasks, "pending")
+    assert pet.get_pending_tasks() == [pending, completed]
+
     pet.remove_task(completed)
     assert completed.pet is None
     assert pet.tasks == [pending]
 
+    # Tasks compare by identity, so an identical-looking but distinct task is kept
+    twin = Task(description="Pending", duration=15, priority=HIGH, pet=pet)
+    assert twin != pending
+    pet.add_task(twin)
+    assert len(pet.tasks) == 2
+
+
+def test_pending_tasks_survive_pickle_round_trip():
+    dog = Pet(name="Buddy", age=3, type="Dog")
+    owner = Owner(name="Alex", pets=[dog])
+    dog.add_task(Task(description="Walk", duration=10))
+
+    restored = pickle.loads(pickle.dumps(owner))
+    assert [task.description for task in restored.get_pending_tasks()] == ["Walk"]
+    assert [task.description for task in restored.pets[0].get_pending_tasks()] == ["Walk"]
+
+
+def test_pet_constructed_with_tasks_refreshes_pending_tasks_after_status_change():
+    walk = Task(description="Walk", duration=10)
+    pet = Pet(name="Buddy", age=3, type="Dog", tasks=[walk])
+    assert walk.pet is pet
+    assert pet.get_pending_tasks() == [walk]
+
+    walk.change_status("completed")
+    assert pet.get_pending_tasks() == []
+
+    walk.status = "pending"
+    assert pet.get_pending_tasks() == [walk]
 
-def test_task_change_status_allows_valid_transitions_and_rejects_invalid():
-    task = Task(description="Walk", duration=30, priority=Priority.HIGH)
 
-    for status in ["scheduled", "completed", "skipped", "pending"]:
-        task.change_status(status)
-        assert task.status == status
+@pytest.mark.parametrize("status", ["scheduled", "completed", "skipped", "pending"])
+def test_task_change_status_accepts_each_valid_status(status):
+    task = Task(description="Walk", duration=30, priority=HIGH, status="skipped")
+
+    task.change_status(status)
+    assert task.status == status
+
+
+def test_task_change_status_rejects_invalid_and_recognises_runtime_built_status():
+    task = Task(description="Walk", duration=30, priority=HIGH)
 
     with pytest.raises(ValueError):
         task.change_status("done")
+    assert task.status == "pending"
+
+    # Statuses built at runtime are still recognised as pending
+    task.change_status("scheduled")
+    task.change_status("".join(["pend", "ing"]))
+    pet = Pet(name="Buddy", age=3, type="Dog")
+    pet.add_task(task)
+    assert pet.get_pending_tasks() == [task]
+
+
+def test_task_bulk_set_status_updates_all_tasks_and_rejects_invalid():
+    tasks = [
+        Task(description="Walk", duration=30, status="scheduled"),
+        Task(description="Feed", duration=10, status="skipped"),
+    ]
+
+    Task.bulk_set_status(tasks, "pending")
+    assert [t.status for t in tasks] == ["pending", "pending"]
+
+    with pytest.raises(ValueError):
+        Task.bulk_set_status(tasks, "done")
+    assert [t.status for t in tasks] == ["pending", "pending"]
 
 
 def test_task_update_task_updates_only_fields_provided():
@@ -80,17 +226,17 @@ def test_task_update_task_updates_only_fields_provided():
     task = Task(
         description="Original",
         duration=30,
-        priority=Priority.MEDIUM,
+        priority=MEDIUM,
         frequency="once",
         time="08:00",
         due_date=due,
     )
 
-    task.update_task(description="Updated", duration=45, priority=Priority.HIGH)
+    task.update_task(description="Updated", duration=45, priority=HIGH)
 
     assert task.description == "Updated"
     assert task.duration == 45
-    assert task.priority == Priority.HIGH
+    assert task.priority == HIGH
     assert task.frequency == "once"
     assert task.time == "08:00"
     assert task.due_date == due
@@ -101,14 +247,21 @@ def test_task_update_task_updates_only_fields_provided():
     assert task.due_date is None
 
 
-def test_recurrence_logic_daily_mark_complete_creates_next_day_task():
+@pytest.mark.parametrize(
+    "frequency, due, expected_next_due",
+    [
+        ("daily", datetime(2026, 2, 10, 9, 0), datetime(2026, 2, 11, 9, 0)),
+        ("weekly", datetime(2026, 2, 1, 12, 0), datetime(2026, 2, 8, 12, 0)),
+        ("once", None, None),
+    ],
+)
+def test_mark_complete_creates_next_occurrence_only_for_recurring_tasks(frequency, due, expected_next_due):
     pet = Pet(name="Buddy", age=4, type="Dog")
-    due = datetime(2026, 2, 10, 9, 0)
     task = Task(
         description="Morning walk",
         duration=30,
-        priority=Priority.HIGH,
-        frequency="daily",
+        priority=HIGH,
+        frequency=frequency,
         due_date=due,
     )
     pet.add_task(task)
@@ -116,29 +269,18 @@ def test_recurrence_logic_daily_mark_complete_creates_next_day_task():
     new_task = task.mark_complete()
 
     assert task.status == "completed"
+    if expected_next_due is None:
+        assert new_task is None
+        assert pet.tasks == [task]
+        return
+
     assert new_task is not None
     assert new_task in pet.tasks
     assert new_task is not task
+    assert new_task.uid != task.uid
     assert new_task.status == "pending"
-    assert new_task.frequency == "daily"
-    assert new_task.due_date == datetime(2026, 2, 11, 9, 0)
-
-
-def test_mark_complete_weekly_creates_next_week_and_non_recurring_returns_none():
-    weekly = Task(
-        description="Weekly meds",
-        duration=10,
-        priority=Priority.HIGH,
-        frequency="weekly",
-        due_date=datetime(2026, 2, 1, 12, 0),
-    )
-    weekly_next = weekly.mark_complete()
-    assert weekly_next is not None
-    assert weekly_next.due_date == datetime(2026, 2, 8, 12, 0)
-
-    once = Task(description="One-off", duration=10, priority=Priority.LOW, frequency="once")
-    assert once.mark_complete() is None
-    assert once.status == "completed"
+    assert new_task.frequency == frequency
+    assert new_task.due_date == expected_next_due
 
 
 def test_generate_schedule_without_owner_returns_empty_schedule_message():
@@ -151,8 +293,7 @@ def test_generate_schedule_without_owner_returns_empty_schedule_message():
     assert schedule["explanation"] == "No owner specified for scheduling."
 
 
-def test_generate_schedule_with_owner_but_no_tasks_returns_no_pending_message():
-    owner = Owner(name="Alex")
+def test_generate_schedule_with_owner_but_no_tasks_returns_no_pending_message(owner):
     owner.add_pet(Pet(name="Buddy", age=4, type="Dog"))
 
     scheduler = Scheduler(owner=owner)
@@ -164,47 +305,43 @@ def test_generate_schedule_with_owner_but_no_tasks_returns_no_pending_message():
     assert schedule["explanation"] == "No pending tasks to schedule."
 
 
-def test_generate_schedule_honors_fixed_time_and_orders_chronologically():
+@pytest.fixture(scope="module")
+def morning_fixed_schedule():
+    """One morning-preference schedule mixing fixed-time (incl. late-night) and flexible tasks"""
     owner = Owner(name="Alex", available_time_minutes=240, preferences={"preferred_time_window": "morning"})
     pet = Pet(name="Buddy", age=4, type="Dog")
     owner.add_pet(pet)
 
-    t1 = Task(description="Noon meal", duration=20, priority=Priority.HIGH, time="12:00")
-    t2 = Task(description="Morning walk", duration=30, priority=Priority.HIGH, time="08:00")
-    t3 = Task(description="Brush", duration=15, priority=Priority.MEDIUM)
-    pet.add_task(t1)
-    pet.add_task(t2)
-    pet.add_task(t3)
+    tasks = {
+        "noon": Task(description="Noon meal", duration=20, priority=HIGH, time="12:00"),
+        "morning": Task(description="Morning walk", duration=30, priority=HIGH, time="08:00"),
+        "late": Task(description="Late-night feed", duration=15, priority=HIGH, time="22:00"),
+        "flexible": Task(description="Brush", duration=15, priority=MEDIUM),
+    }
+    for task in tasks.values():
+        pet.add_task(task)
+
+    return tasks, Scheduler(owner=owner).generate_schedule()
 
-    schedule = Scheduler(owner=owner).generate_schedule()
+
+def test_generate_schedule_honors_fixed_time_and_orders_chronologically(morning_fixed_schedule):
+    tasks, schedule = morning_fixed_schedule
 
     starts = [item["start_time_minutes"] for item in schedule["scheduled_tasks"]]
     assert starts == sorted(starts)  # Sorting correctness: chronological output
 
-    fixed_entry = next(item for item in schedule["scheduled_tasks"] if item["task"] is t2)
+    fixed_entry = entries_by_task(schedule["scheduled_tasks"])[tasks["morning"]]
     assert fixed_entry["start_time_minutes"] == 8 * 60
     assert fixed_entry["time_range"].startswith("08:00")
-    assert t1.status == "scheduled"
-    assert t2.status == "scheduled"
-    assert t3.status == "scheduled"
-
-
-def test_generate_schedule_fixed_task_outside_preference_is_still_scheduled():
-    owner = Owner(
-        name="Alex",
-        available_time_minutes=120,
-        preferences={"preferred_time_window": "morning"},
-    )
-    pet = Pet(name="Whiskers", age=2, type="Cat")
-    owner.add_pet(pet)
+    assert all(task.status == "scheduled" for task in tasks.values())
 
-    late = Task(description="Late-night feed", duration=15, priority=Priority.HIGH, time="22:00")
-    pet.add_task(late)
 
-    schedule = Scheduler(owner=owner).generate_schedule()
+def test_generate_schedule_fixed_task_outside_preference_is_still_scheduled(morning_fixed_schedule):
+    tasks, schedule = morning_fixed_schedule
+    late = tasks["late"]
 
-    assert late in [item["task"] for item in schedule["scheduled_tasks"]]
-    assert late not in [item["task"] for item in schedule["skipped_tasks"]]
+    assert late in entries_by_task(schedule["scheduled_tasks"])
+    assert late not in entries_by_task(schedule["skipped_tasks"])
 
 
 def test_generate_schedule_skips_invalid_durations_and_insufficient_total_time():
@@ -212,22 +349,19 @@ def test_generate_schedule_skips_invalid_durations_and_insufficient_total_time()
     pet = Pet(name="Buddy", age=5, type="Dog")
     owner.add_pet(pet)
 
-    invalid = Task(description="Invalid", duration=0, priority=Priority.HIGH)
-    too_long = Task(description="Too long", duration=30, priority=Priority.MEDIUM)
+    invalid = Task(description="Invalid", duration=0, priority=HIGH)
+    too_long = Task(description="Too long", duration=30, priority=MEDIUM)
     pet.add_task(invalid)
     pet.add_task(too_long)
 
     schedule = Scheduler(owner=owner).generate_schedule()
 
-    invalid_reason = next(
-        item["reason"] for item in schedule["skipped_tasks"] if item["task"] is invalid
-    )
+    skipped = entries_by_task(schedule["skipped_tasks"])
+    invalid_reason = skipped[invalid]["reason"]
     assert invalid_reason == "Task has no valid duration specified"
     assert invalid.status == "pending"  # current implementation does not set skipped here
 
-    too_long_reason = next(
-        item["reason"] for item in schedule["skipped_tasks"] if item["task"] is too_long
-    )
+    too_long_reason = skipped[too_long]["reason"]
     assert "Insufficient total available time" in too_long_reason
     assert too_long.status == "skipped"
 
@@ -238,14 +372,14 @@ def test_generate_schedule_uses_fallback_window_when_preferred_window_has_no_slo
     owner.add_pet(pet)
 
     # Occupies 18:00-24:00 so there is no evening slot left for flexible tasks.
-    block_evening = Task(description="Evening meds", duration=360, priority=Priority.HIGH, time="18:00")
-    flexible = Task(description="Quick brush", duration=30, priority=Priority.MEDIUM)
+    block_evening = Task(description="Evening meds", duration=360, priority=HIGH, time="18:00")
+    flexible = Task(description="Quick brush", duration=30, priority=MEDIUM)
     pet.add_task(block_evening)
     pet.add_task(flexible)
 
     schedule = Scheduler(owner=owner).generate_schedule()
 
-    flexible_entry = next(item for item in schedule["scheduled_tasks"] if item["task"] is flexible)
+    flexible_entry = entries_by_task(schedule["scheduled_tasks"])[flexible]
     assert flexible_entry["start_time_minutes"] == 0
 
 
@@ -255,54 +389,76 @@ def test_generate_schedule_skips_when_no_contiguous_slot_even_if_total_free_time
     owner.add_pet(pet)
 
     # Four 30-minute gaps remain (120 total), but no 40-minute contiguous slot.
-    pet.add_task(Task(description="A", duration=300, priority=Priority.HIGH, time="00:00"))  # 00:00-05:00
-    pet.add_task(Task(description="B", duration=300, priority=Priority.HIGH, time="05:30"))  # 05:30-10:30
-    pet.add_task(Task(description="C", duration=300, priority=Priority.HIGH, time="11:00"))  # 11:00-16:00
-    pet.add_task(Task(description="D", duration=300, priority=Priority.HIGH, time="16:30"))  # 16:30-21:30
-    pet.add_task(Task(description="E", duration=120, priority=Priority.HIGH, time="22:00"))  # 22:00-24:00
-    target = Task(description="Needs 40", duration=40, priority=Priority.MEDIUM)
+    pet.add_task(Task(description="A", duration=300, priority=HIGH, time="00:00"))  # 00:00-05:00
+    pet.add_task(Task(description="B", duration=300, priority=HIGH, time="05:30"))  # 05:30-10:30
+    pet.add_task(Task(description="C", duration=300, priority=HIGH, time="11:00"))  # 11:00-16:00
+    pet.add_task(Task(description="D", duration=300, priority=HIGH, time="16:30"))  # 16:30-21:30
+    pet.add_task(Task(description="E", duration=120, priority=HIGH, time="22:00"))  # 22:00-24:00
+    target = Task(description="Needs 40", duration=40, priority=MEDIUM)
     pet.add_task(target)
 
     schedule = Scheduler(owner=owner).generate_schedule()
 
-    assert target in [item["task"] for item in schedule["skipped_tasks"]]
-    reason = next(item["reason"] for item in schedule["skipped_tasks"] if item["task"] is target)
+    skipped = entries_by_task(schedule["skipped_tasks"])
+    assert target in skipped
+    reason = skipped[target]["reason"]
     assert "Insufficient time remaining" in reason
     assert target.status == "skipped"
 
 
-def test_scheduler_helper_methods_cover_defaults_and_time_conversion():
-    scheduler = Scheduler(owner=Owner(name="Alex"))
-
+def test_scheduler_helper_methods_cover_defaults_and_time_conversion(scheduler):
     assert scheduler._calculate_total_available_time() == 480
     assert scheduler._get_start_time() == 480
     assert scheduler._format_time(65) == "01:05"
     assert scheduler._time_to_minutes("01:05") == 65
+    assert scheduler._time_to_minutes("23:59") == 23 * 60 + 59
+    assert scheduler._time_to_minutes("7:30") == 7 * 60 + 30
+    assert scheduler._time_to_minutes(" 9:30") == 9 * 60 + 30
+    for malformed in ["08-30", "ab:cd", "noon"]:
+        with pytest.raises(ValueError):
+            scheduler._time_to_minutes(malformed)
     assert scheduler._can_fit_task(Task(description="x", duration=10), 10)
     assert not scheduler._can_fit_task(Task(description="x", duration=None), 10)
 
+    intervals = [(0, 470), (500, 600), (700, 800)]
+    assert scheduler._find_available_slot(25, intervals, 0, 480) == 470  # gap straddles window end
+    assert scheduler._find_available_slot(40, intervals, 0, 480) is None
+    assert scheduler._find_available_slot(40, intervals, 480, 24 * 60) == 600
 
-def test_scheduler_get_start_time_handles_known_and_unknown_windows():
-    owner = Owner(name="Alex", preferences={"preferred_time_window": "afternoon"})
-    scheduler = Scheduler(owner=owner)
-    assert scheduler._get_start_time() == 720
 
-    owner.preferences["preferred_time_window"] = "unknown"
-    assert scheduler._get_start_time() == 480
+@pytest.mark.parametrize(
+    "window, expected_start",
+    [
+        ("morning", 360),
+        ("afternoon", 720),
+        ("Evening", 1080),
+        ("unknown", 480),
+    ],
+)
+def test_scheduler_get_start_time_handles_known_and_unknown_windows(window, expected_start):
+    owner = Owner(name="Alex", preferences={"preferred_time_window": window})
+    assert Scheduler(owner=owner)._get_start_time() == expected_start
 
 
-def test_sort_by_priority_orders_high_first_then_shorter_duration():
-    scheduler = Scheduler(owner=Owner(name="Alex"))
-    low = Task(description="low", duration=5, priority=Priority.LOW)
-    high_long = Task(description="high long", duration=20, priority=Priority.HIGH)
-    high_short = Task(description="high short", duration=10, priority=Priority.HIGH)
+def test_sort_by_priority_orders_high_first_then_shorter_duration(scheduler):
+    low = Task(description="low", duration=5, priority=LOW)
+    high_long = Task(description="high long", duration=20, priority=HIGH)
+    high_short = Task(description="high short", duration=10, priority=HIGH)
 
     ordered = scheduler._sort_tasks_by_priority([low, high_long, high_short])
     assert ordered == [high_short, high_long, low]
 
+    low.update_task(priority=HIGH, duration=5)
+    assert scheduler._sort_tasks_by_priority([high_long, high_short, low]) == [low, high_short, high_long]
+
+    # Direct field writes are picked up too
+    high_long.duration = 1
+    assert scheduler._sort_tasks_by_priority([low, high_short, high_long]) == [high_long, low, high_short]
+    high_long.priority = LOW
+    assert scheduler._sort_tasks_by_priority([high_long, low, high_short]) == [low, high_short, high_long]
 
-def test_sort_by_time_returns_chronological_then_none_times():
-    scheduler = Scheduler(owner=Owner(name="Alex"))
+
+def test_sort_by_time_returns_chronological_then_none_times(scheduler):
     t1 = Task(description="late", duration=10, time="12:30")
     t2 = Task(description="early", duration=10, time="08:00")
     t3 = Task(description="unscheduled", duration=10, time=None)
@@ -310,9 +466,44 @@ def test_sort_by_time_returns_chronological_then_none_times():
     ordered = scheduler.sort_by_time([t1, t3, t2])
     assert ordered == [t2, t1, t3]
 
+    t3.update_task(time="07:15")
+    t2.update_task(time=None)
+    assert scheduler.sort_by_time([t1, t2, t3]) == [t3, t1, t2]
+
+
+def test_malformed_time_is_accepted_on_construction_and_sorted_after_parsed_times(scheduler):
+    noon = Task(description="Lunch", duration=10, time="noon")
+    walk = Task(description="Walk", duration=30, time="08:00")
+    unscheduled = Task(description="Brush", duration=5)
 
-def test_filter_tasks_by_pet_name_and_status_case_insensitive():
-    scheduler = Scheduler(owner=Owner(name="Alex"))
+    assert scheduler.sort_by_time([unscheduled, noon, walk]) == [walk, noon, unscheduled]
+
+    # Scheduling and conflict checks still need real minutes, so they reject it
+    with pytest.raises(ValueError):
+        scheduler.detect_conflicts([walk, noon])
+    owner = Owner(name="Alex", pets=[Pet(name="Buddy", age=3, type="Dog", tasks=[noon])])
+    with pytest.raises(ValueError):
+        Scheduler(owner=owner).generate_schedule()
+
+    noon.update_task(time="12:00")
+    assert scheduler.sort_by_time([noon, walk]) == [walk, noon]
+
+
+def test_direct_time_assignment_refreshes_cached_minutes(scheduler):
+    walk = Task(description="Walk", duration=30, time="09:00")
+    feed = Task(description="Feed", duration=15, time="08:00")
+    block = Task(description="Block", duration=60, time="06:30")
+
+    walk.time = "07:00"
+    assert scheduler.sort_by_time([feed, walk]) == [walk, feed]
+    assert [(c["task1"], c["task2"]) for c in scheduler.detect_conflicts([block, walk])] == [(block, walk)]
+
+    owner = Owner(name="Alex", pets=[Pet(name="Buddy", age=3, type="Dog", tasks=[walk])])
+    entry = Scheduler(owner=owner).generate_schedule()["scheduled_tasks"][0]
+    assert entry["time_range"] == "07:00 - 07:30"
+
+
+def test_filter_tasks_by_pet_name_and_status_case_insensitive(scheduler):
     dog = Pet(name="Buddy", age=2, type="Dog")
     cat = Pet(name="Milo", age=3, type="Cat")
 
@@ -325,14 +516,19 @@ def test_filter_tasks_by_pet_name_and_status_case_insensitive():
     assert scheduler.filter_tasks(tasks, status="PENDING") == [t1, t3]
     assert scheduler.filter_tasks(tasks, pet_name="milo", status="pending") == [t3]
 
+    # Names compare casefolded, and tasks without a pet never match a name
+    strasse_pet = Pet(name="Straße", age=1, type="Cat")
+    t4 = Task(description="Brush", duration=5, pet=strasse_pet)
+    stray = Task(description="Stray", duration=5)
+    assert scheduler.filter_tasks([t4, stray, t1], pet_name="STRASSE") == [t4]
+
 
-def test_conflict_detection_flags_duplicate_times_and_reports_message():
-    owner = Owner(name="Alex")
+def test_conflict_detection_flags_duplicate_times_and_reports_message(owner):
     pet = Pet(name="Buddy", age=4, type="Dog")
     owner.add_pet(pet)
 
-    task1 = Task(description="Walk", duration=30, priority=Priority.HIGH, time="08:00", pet=pet)
-    task2 = Task(description="Feed", duration=15, priority=Priority.MEDIUM, time="08:00", pet=pet)
+    task1 = Task(description="Walk", duration=30, priority=HIGH, time="08:00", pet=pet)
+    task2 = Task(description="Feed", duration=15, priority=MEDIUM, time="08:00", pet=pet)
 
     conflicts = Scheduler(owner=owner).detect_conflicts([task1, task2])
 
@@ -342,16 +538,41 @@ def test_conflict_detection_flags_duplicate_times_and_reports_message():
     assert "CONFLICT" in conflicts[0]["message"]
 
 
-def test_conflict_detection_ignores_back_to_back_or_missing_time_duration():
-    scheduler = Scheduler(owner=Owner(name="Alex"))
+@pytest.mark.parametrize(
+    "specs, expected_pairs",
+    [
+        ([(30, "08:00"), (15, "08:00")], [(0, 1)]),  # same start time
+        ([(30, "08:00"), (30, "08:30")], []),  # touches boundary, no overlap
+        ([(30, "08:00"), (None, "08:15"), (20, None)], []),  # missing duration or time
+    ],
+)
+def test_conflict_detection_flags_overlaps_and_ignores_back_to_back_or_missing_fields(
+    scheduler, specs, expected_pairs
+):
+    tasks = [
+        Task(description=f"T{i}", duration=duration, time=time)
+        for i, (duration, time) in enumerate(specs)
+    ]
+
+    conflicts = scheduler.detect_conflicts(tasks)
+    assert [(c["task1"], c["task2"]) for c in conflicts] == [(tasks[i], tasks[j]) for i, j in expected_pairs]
+
+
+def test_conflict_detection_reports_every_overlapping_pair_in_input_order(scheduler):
+    long_task = Task(description="Long", duration=120, time="08:00")
+    late = Task(description="Late", duration=30, time="09:30")
+    early = Task(description="Early", duration=30, time="08:15")
+    zero = Task(description="Zero", duration=0, time="08:30")
+    after = Task(description="After", duration=15, time="10:00")
 
-    t1 = Task(description="A", duration=30, time="08:00")
-    t2 = Task(description="B", duration=30, time="08:30")  # touches boundary, no overlap
-    t3 = Task(description="C", duration=None, time="08:15")
-    t4 = Task(description="D", duration=20, time=None)
+    conflicts = scheduler.detect_conflicts([long_task, late, early, zero, after])
 
-    conflicts = scheduler.detect_conflicts([t1, t2, t3, t4])
-    assert conflicts == []
+    assert [(c["task1"], c["task2"]) for c in conflicts] == [
+        (long_task, late),
+        (long_task, early),
+        (long_task, zero),  # a zero-length task strictly inside another still conflicts
+        (early, zero),
+    ]
 
 
 def test_generate_schedule_explanation_contains_owner_preference_and_summary_sections():
@@ -359,8 +580,8 @@ def test_generate_schedule_explanation_contains_owner_preference_and_summary_sec
     pet = Pet(name="Buddy", age=3, type="Dog")
     owner.add_pet(pet)
 
-    pet.add_task(Task(description="Walk", duration=20, priority=Priority.HIGH))
-    pet.add_task(Task(description="Big task", duration=50, priority=Priority.MEDIUM))
+    pet.add_task(Task(description="Walk", duration=20, priority=HIGH))
+    pet.add_task(Task(description="Big task", duration=50, priority=MEDIUM))
 
     schedule = Scheduler(owner=owner).generate_schedule()
     explanation = schedule["explanation"]